@@ -29,16 +29,54 @@ Author: PsCustomObject (2025)
 import os
 import hashlib
 import json
+import mmap
 import re
+import sys
 import argparse
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 
+# orjson parses/serializes several times faster than stdlib json; the
+# cache stays human-diffable either way thanks to 2-space indenting.
+try:
+    import orjson
+
+    def _json_dumps(data):
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+
+    def _json_loads(raw):
+        return orjson.loads(raw)
+
+except ImportError:
+
+    def _json_dumps(data):
+        return json.dumps(data, indent=2).encode("utf-8")
+
+    def _json_loads(raw):
+        return json.loads(raw)
+
 SOURCE_DIR = Path(".").resolve()
 DOCS_DIR = SOURCE_DIR / "docs"
 HASH_FILE = SOURCE_DIR / ".sync_hashes.json"
-EXCLUDE_DIRS = {"docs", ".git", "__pycache__"}
+EXCLUDE_DIRS = frozenset({"docs", ".git", "__pycache__"})
 TOC_MARKER = "<!-- TOC:DO-NOT-EDIT -->"
 
+# Per-file read/hash work is I/O-bound (hashlib releases the GIL too),
+# so a shared thread pool scales it up to disk concurrency.
+_EXECUTOR = ThreadPoolExecutor(max_workers=min(32, (os.cpu_count() or 1) * 4))
+
+# Hot-path regexes, compiled once instead of hitting re's cache per call
+_CHAPTER_RE = re.compile(r"chapter-(\d+)[-_ ]?(.*)\.md", re.IGNORECASE)
+_TITLE_BRACKET_RE = re.compile(r"\[(.*?)\]")
+_NATSPLIT_RE = re.compile(r"(\d+)")
+
+# Front-matter assembled directly as bytes — the output and the hasher
+# both want bytes, so there is no str build + encode step per file.
+_FM_TITLE = b'---\ntitle: "%b"\n'
+_FM_PARENT = b"parent: %b\n"
+_FM_ORDER = b"nav_order: %d\n---\n\n"
+
 section_title_map = {
     "reading_notes": "Reading Notes",
     "meta": "Meta",
@@ -65,33 +103,152 @@ def read_file_clean(path):
     return raw.decode("utf-8-sig")
 
 
-def sha256(text):
-    """Calculates SHA256 hash of a string."""
-    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+def sha256(data):
+    """Calculates SHA256 hash of raw bytes."""
+    return hashlib.sha256(data).hexdigest()
+
+
+# Bodies above this size are hashed through mmap instead of a full read
+_MMAP_THRESHOLD = 1024 * 1024
+
+
+def hash_note(front_matter_bytes, path):
+    """
+    SHA256 of front matter + file body without concatenating the two.
+
+    Feeds the hash object incrementally so no prefix+body copy is ever
+    built. Bodies above _MMAP_THRESHOLD are mapped with mmap and hashed
+    straight from the page cache. Returns (hexdigest, body_bytes).
+    """
+    h = hashlib.sha256(front_matter_bytes)
+    with open(path, "rb") as f:
+        size = os.fstat(f.fileno()).st_size
+        if size > _MMAP_THRESHOLD:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                view = memoryview(mm)
+                if mm[:3] == b"\xef\xbb\xbf":
+                    view = view[3:]
+                h.update(view)
+                body = bytes(view)
+                view.release()
+        else:
+            body = f.read().removeprefix(b"\xef\xbb\xbf")
+            h.update(body)
+    return h.hexdigest(), body
 
 
+@lru_cache(maxsize=4096)
 def parse_chapter_title(filename):
-    """Parses filename for chapter number and title."""
-    match = re.match(r"chapter-(\d+)[-_ ]?(.*)\.md", filename, re.IGNORECASE)
+    """Parses filename for chapter number and title (memoized; called once
+    per file in the sync pass and again in the TOC pass)."""
+    match = _CHAPTER_RE.match(filename)
     if match:
         chapter_number = int(match.group(1))
         raw_title = match.group(2).replace("-", " ").replace("_", " ").title()
         return chapter_number, f"Chapter {chapter_number} – {raw_title}"
-    return None, Path(filename).stem.replace("-", " ").replace("_", " ").title()
+    # Callers only pass .md names, so the stem is a plain slice — no
+    # Path object allocation on this hot path.
+    stem = filename[:-3] if filename.endswith(".md") else Path(filename).stem
+    return None, stem.replace("-", " ").replace("_", " ").title()
+
+
+def walk_scandir(root, exclude):
+    """
+    Yields (dirpath, md_entries) pairs for root and every non-excluded subdirectory.
+
+    Uses os.scandir instead of os.walk so the is_dir/is_file checks reuse the
+    dirent type data the kernel already returned (no extra stat per entry),
+    and excluded directories are skipped *before* descending into them.
+    md_entries are the directory's .md DirEntry objects, sorted by name.
+    """
+    subdirs = []
+    md_entries = []
+    with os.scandir(root) as it:
+        for entry in it:
+            if entry.is_dir(follow_symlinks=False):
+                if entry.name not in exclude:
+                    subdirs.append(entry.path)
+            elif entry.is_file(follow_symlinks=False) and entry.name.endswith(".md"):
+                md_entries.append(entry)
+    md_entries.sort(key=lambda e: e.name)
+    yield root, md_entries
+    for subdir in sorted(subdirs):
+        yield from walk_scandir(subdir, exclude)
+
+
+# Status lines are buffered and flushed once per directory: print() takes
+# the stdout lock and flushes per call, which is measurable across
+# thousands of files and would contend with the worker pool.
+_MSG_BUFFER = []
+
+
+def _log(msg):
+    """Queues a status line for the next _flush_log()."""
+    _MSG_BUFFER.append(msg)
+
+
+def _flush_log():
+    """Emits all queued status lines in a single stdout write."""
+    if _MSG_BUFFER:
+        sys.stdout.write("\n".join(_MSG_BUFFER) + "\n")
+        _MSG_BUFFER.clear()
+
+
+def atomic_write_bytes(path, data):
+    """
+    Writes data to path via a .tmp sibling and os.replace, so readers
+    (and a crash mid-write) only ever see the old or the new content.
+    """
+    tmp = f"{path}.tmp"
+    with open(tmp, "wb") as f:
+        f.write(data)
+    os.replace(tmp, path)
 
 
 def load_hashes():
     """Loads file hashes from cache file."""
     if HASH_FILE.exists():
-        with open(HASH_FILE, "r") as f:
-            return json.load(f)
+        return _json_loads(HASH_FILE.read_bytes())
     return {}
 
 
 def save_hashes(data):
     """Saves file hashes to cache file."""
-    with open(HASH_FILE, "w") as f:
-        json.dump(data, f, indent=2)
+    HASH_FILE.write_bytes(_json_dumps(data))
+
+
+def _entry_hash(cache_entry):
+    """Returns the content hash from a cache entry (new dict or legacy string)."""
+    if isinstance(cache_entry, dict):
+        return cache_entry.get("hash")
+    return cache_entry
+
+
+class _LazyReverseMap:
+    """
+    Inverse of the hash cache (content hash -> rel path), used only for
+    rename detection. Materialized on first lookup so idempotent runs —
+    where no hash ever mismatches — never pay the O(N) inversion.
+    """
+
+    def __init__(self, cache):
+        self._cache = cache
+        self._map = None
+
+    def get(self, file_hash):
+        if self._map is None:
+            self._map = {_entry_hash(v): k for k, v in self._cache.items()}
+        return self._map.get(file_hash)
+
+
+def _compute_title_key(markdown_item):
+    """
+    Natural-sort key for a TOC line '- [Title](file.md)': extracts the
+    [Title] part and splits it into numeric/non-numeric chunks.
+    """
+    m = _TITLE_BRACKET_RE.search(markdown_item)
+    title = m.group(1) if m else markdown_item
+    return [int(t) if t.isdigit() else t.lower() for t in _NATSPLIT_RE.split(title)]
 
 
 def create_or_update_section_index(
@@ -121,7 +278,7 @@ Notes for the **{title}** section."""
         existing = read_file_clean(index_file)
 
         if not existing or TOC_MARKER not in existing:
-            print(
+            _log(
                 f"⚠️ Warning: index.md empty or TOC_MARKER invalid for {target_dir}. Rebuilding header."
             )
             content_before = default_content.rstrip()
@@ -142,46 +299,88 @@ Notes for the **{title}** section."""
         + "---\n\n"  # horizontal rule + blank line
     )
 
-    # Concatenate header + TOC block
-    content = f"{content_before}{TOC_MARKUP_STRING}"
-    if not content.endswith("\n"):
-        content += "\n"
+    # Assemble header + TOC block in a list; a single join at the end
+    # avoids reallocating a growing string per piece.
+    parts = [content_before, TOC_MARKUP_STRING]
 
     # Build and insert chapter list
     if chapter_links:
         # De-duplicate exact duplicates
         unique = list(dict.fromkeys(chapter_links))
 
-        # Natural sort by TITLE (extract the [...] part)
-        def _title_key(s: str):
-            m = re.search(r"\[(.*?)\]", s)
-            title = m.group(1) if m else s
-            # Split into numeric/non-numeric chunks for natural ordering
-            return [
-                int(t) if t.isdigit() else t.lower() for t in re.split(r"(\d+)", title)
-            ]
-
-        unique_sorted = sorted(unique, key=_title_key)
+        # Natural sort by TITLE: compute each key exactly once, then let
+        # the sort do plain dict lookups.
+        keys = {s: _compute_title_key(s) for s in unique}
+        parts.append("\n".join(sorted(unique, key=keys.__getitem__)))
 
-        content += "\n".join(unique_sorted)
+    content = "".join(parts)
 
-        # Ensure the file ends with a newline for stable diffs
-        if not content.endswith("\n"):
-            content += "\n"
+    # Ensure the file ends with a newline for stable diffs
+    if not content.endswith("\n"):
+        content += "\n"
 
     # --- Index Stability Fix: write only if different ---
     if index_file.exists():
         existing_content = read_file_clean(index_file)
         if existing_content == content:
-            print(f"📁 Index is up to date: {index_file}")
+            _log(f"📁 Index is up to date: {index_file}")
             return  # Content is the same, skip write and reporting 'updated'.
 
     # Only write if: 1) index_file did not exist, or 2) existing_content != content
     if not dry_run:
-        with open(index_file, "w", encoding="utf-8") as f:
-            f.write(content)
+        atomic_write_bytes(index_file, content.encode("utf-8"))
+
+    _log(f"📁 Index {'would be updated' if dry_run else 'updated'}: {index_file}")
+
 
-    print(f"📁 Index {'would be updated' if dry_run else 'updated'}: {index_file}")
+def _process_file(entry, hash_key, section_title, fallback_nav_order, cache, reverse_hash_map):
+    """
+    Per-file worker: stat fast-path, front matter build, and hashing.
+
+    Touches no shared state so it can run on the thread pool; the caller
+    applies deletes/writes and merges the result serially.
+    Returns (hash_key, cache_entry, final_bytes_or_None, needs_write, old_path).
+    """
+    chapter_num, title = parse_chapter_title(entry.name)
+    nav_order_entry = chapter_num if chapter_num else fallback_nav_order
+
+    fm_parts = [_FM_TITLE % title.encode("utf-8")]
+    if section_title:
+        fm_parts.append(_FM_PARENT % section_title.encode("utf-8"))
+    fm_parts.append(_FM_ORDER % nav_order_entry)
+    front_matter_bytes = b"".join(fm_parts)
+    fm_hash = sha256(front_matter_bytes)
+
+    # Stat fast-path: size+mtime covers only the body — nav_order falls
+    # back to directory position, so the front matter can change under an
+    # untouched file (e.g. a new sibling shifts everyone). The fm_hash
+    # check catches that; entries without one (legacy) recompute once.
+    st = entry.stat()
+    cached = cache.get(hash_key)
+    if (
+        isinstance(cached, dict)
+        and cached.get("mtime_ns") == st.st_mtime_ns
+        and cached.get("size") == st.st_size
+        and cached.get("fm_hash") == fm_hash
+    ):
+        return hash_key, cached, None, False, None
+
+    # Stream front matter + raw body into the hasher; no concat copy
+    file_hash, body = hash_note(front_matter_bytes, entry.path)
+    new_entry = {
+        "hash": file_hash,
+        "fm_hash": fm_hash,
+        "mtime_ns": st.st_mtime_ns,
+        "size": st.st_size,
+    }
+
+    needs_write = _entry_hash(cached) != file_hash
+    if not needs_write:
+        return hash_key, new_entry, None, False, None
+
+    old_key = reverse_hash_map.get(file_hash)
+    old_path = DOCS_DIR / old_key if old_key else None
+    return hash_key, new_entry, front_matter_bytes + body, True, old_path
 
 
 def sync_notes(dry_run=False, clean=False):
@@ -194,24 +393,27 @@ def sync_notes(dry_run=False, clean=False):
         )
 
     cache = load_hashes()
+    # Side table of verified destination hashes, kept under a reserved key
+    # so steady-state runs can skip even the read-back of docs/ files.
+    dst_hashes = cache.pop("__dst__", {})
+    new_dst_hashes = {}
     updated = {}
     any_synced = False
-    reverse_hash_map = {v: k for k, v in cache.items()}
-    seen_hashes = set()
+    reverse_hash_map = _LazyReverseMap(cache)
 
-    for root, _, files in os.walk(SOURCE_DIR):
-        rel = Path(root).relative_to(SOURCE_DIR)
-        if any(p in EXCLUDE_DIRS for p in rel.parts):
-            continue
+    src_prefix = str(SOURCE_DIR)
+
+    for root, md_entries in walk_scandir(src_prefix, EXCLUDE_DIRS):
+        # Cheap string slice instead of Path.relative_to; empty for the root itself
+        rel = root[len(src_prefix) + 1 :]
 
-        md_files = sorted(f for f in files if f.endswith(".md"))
-        if not md_files:
+        if not md_entries:
             continue
 
-        target_dir = DOCS_DIR / rel
+        target_dir = DOCS_DIR / rel if rel else DOCS_DIR
         target_dir.mkdir(parents=True, exist_ok=True)
 
-        section_name = rel.name if rel.parts else None
+        section_name = os.path.basename(root) if rel else None
         nav_order = (
             section_order_map.get(section_name.lower(), 90) if section_name else 1
         )
@@ -222,58 +424,79 @@ def sync_notes(dry_run=False, clean=False):
         )
 
         # --- File Sync Pass ---
-        for i, fname in enumerate(md_files):
+        # Fan the independent read/hash work out to the pool, then apply
+        # deletes/writes and merge results serially on the main thread.
+        futures = []
+        for i, entry in enumerate(md_entries):
+            fname = entry.name
             if fname.lower() == "index.md":
                 continue
+            hash_key = entry.path[len(src_prefix) + 1 :]
+            futures.append(
+                (
+                    fname,
+                    _EXECUTOR.submit(
+                        _process_file,
+                        entry,
+                        hash_key,
+                        section_title,
+                        i + 1,
+                        cache,
+                        reverse_hash_map,
+                    ),
+                )
+            )
 
-            src_file = Path(root) / fname
-            dst_file = target_dir / fname
-            body = read_file_clean(src_file)
-
-            chapter_num, title = parse_chapter_title(fname)
-            nav_order_entry = chapter_num if chapter_num else (i + 1)
-
-            front_matter = f'---\ntitle: "{title}"\n'
-            if section_title:
-                front_matter += f"parent: {section_title}\n"
-            front_matter += f"nav_order: {nav_order_entry}\n---\n\n"
-
-            final = front_matter + body
-            file_hash = sha256(final)
-            hash_key = str(src_file.relative_to(SOURCE_DIR))
-            updated[hash_key] = file_hash
-            seen_hashes.add(file_hash)
-
-            if cache.get(hash_key) != file_hash:
-                if file_hash in reverse_hash_map:
-                    old_key = reverse_hash_map[file_hash]
-                    old_path = DOCS_DIR / old_key
-                    if old_path.exists():
-                        if not dry_run:
-                            old_path.unlink()
-                        print(f"🔄 Renamed (deleted old): {old_path}")
+        chapter_links = []
+        for fname, future in futures:
+            # TOC entry for every synced file (memoized title parse)
+            _, link_title = parse_chapter_title(fname)
+            chapter_links.append(f"- [{link_title}]({fname})")
 
-                if not dry_run:
-                    with open(dst_file, "w", encoding="utf-8") as f:
-                        f.write(final)
-                print(f"{'📝 Would sync' if dry_run else '✅ Synced'}: {dst_file}")
-                any_synced = True
+            hash_key, cache_entry, final, needs_write, old_path = future.result()
+            updated[hash_key] = cache_entry
+            file_hash = _entry_hash(cache_entry)
 
-        # --- TOC Generation Pass (runs unconditionally) ---
-        chapter_links = []
-        for fname in md_files:
-            if fname.lower() == "index.md":
+            if not needs_write:
+                new_dst_hashes[hash_key] = dst_hashes.get(hash_key, file_hash)
                 continue
 
-            _, title = parse_chapter_title(fname)
-            chapter_links.append(f"- [{title}]({fname})")
+            if old_path is not None and old_path.exists():
+                if not dry_run:
+                    old_path.unlink()
+                _log(f"🔄 Renamed (deleted old): {old_path}")
+
+            dst_file = target_dir / fname
+
+            # The destination may already hold exactly this content (e.g.
+            # right after --clean wiped the cache): verify cheaply — side
+            # table first, then size + hash — before dirtying the file.
+            if dst_hashes.get(hash_key) == file_hash:
+                new_dst_hashes[hash_key] = file_hash
+                continue
+            try:
+                if os.stat(dst_file).st_size == len(final):
+                    if sha256(dst_file.read_bytes()) == file_hash:
+                        new_dst_hashes[hash_key] = file_hash
+                        continue
+            except OSError:
+                pass
+
+            if not dry_run:
+                atomic_write_bytes(dst_file, final)
+            new_dst_hashes[hash_key] = file_hash
+            _log(f"{'📝 Would sync' if dry_run else '✅ Synced'}: {dst_file}")
+            any_synced = True
 
         if section_title:
             create_or_update_section_index(
                 target_dir, nav_order, chapter_links, dry_run=dry_run
             )
 
+        _flush_log()
+
     if not dry_run:
+        updated["__dst__"] = new_dst_hashes
         save_hashes(updated)
 
     print(
@@ -10,25 +10,47 @@ from pathlib import Path
 SOURCE_DIR = Path(".").resolve()
 EXCLUDE_DIRS = {"docs", ".git", "__pycache__"}
 
+def build_md_map(root: Path, exclude=EXCLUDE_DIRS) -> dict:
+    """Single post-order scandir pass: maps each directory's absolute path to
+    True iff its subtree contains a non-index .md file. Replaces the old
+    per-child re-walks so no directory is ever read twice."""
+    md_map = {}
+
+    def _scan(path: str) -> bool:
+        has_md = False
+        with os.scandir(path) as it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    if entry.name not in exclude:
+                        has_md = _scan(entry.path) or has_md
+                elif not has_md and entry.is_file(follow_symlinks=False):
+                    name = entry.name
+                    if name.endswith(".md") and name.lower() != "index.md":
+                        has_md = True
+        md_map[path] = has_md
+        return has_md
+
+    _scan(str(root))
+    return md_map
+
+MD_MAP = build_md_map(SOURCE_DIR)
+
 def has_markdown_files_recursive(directory: Path) -> bool:
     """Check if a directory or any of its subdirectories contain markdown files (excludes index.md)."""
-    for root, _, files in os.walk(directory):
-        if any(f.endswith(".md") and f.lower() != "index.md" for f in files):
-            return True
-    return False
+    return MD_MAP.get(str(directory), False)
 
 def has_child_dir_with_markdown(rel_path: Path) -> bool:
     """Return True if rel_path has at least one immediate child directory with markdown."""
     src_dir = SOURCE_DIR / rel_path
     if not src_dir.exists() or not src_dir.is_dir():
         return False
-    
+
     child_dirs = []
     for child in src_dir.iterdir():
         if child.is_dir() and child.name not in EXCLUDE_DIRS:
             has_md = has_markdown_files_recursive(child)
             child_dirs.append((child.name, has_md))
-    
+
     return child_dirs
 
 print("=" * 70)
@@ -44,7 +66,7 @@ for item in sorted(SOURCE_DIR.iterdir()):
     print(f"\n📁 {item.name}/")
     
     # Check for direct MD files
-    md_files = [f for f in item.iterdir() if f.is_file() and f.suffix == '.md' and f.name.lower() != 'index.md']
+    md_files = [f for f in item.iterdir() if f.is_file() and f.name.endswith('.md') and f.name.lower() != 'index.md']
     if md_files:
         print(f"   📄 Direct .md files: {len(md_files)}")
         for f in md_files[:3]:  # Show first 3
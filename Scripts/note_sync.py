@@ -37,6 +37,8 @@ import hashlib
 import json
 import re
 import argparse
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 
 SOURCE_DIR = Path(".").resolve()
@@ -47,6 +49,23 @@ EXCLUDE_DIRS = {"docs", ".git", "__pycache__"}
 # Manual TOC marker only used when --manual-toc is enabled
 TOC_MARKER = "<!-- TOC:DO-NOT-EDIT -->"
 
+# Cache schema version: v3 stores {size, mtime_ns, body_hash, fm_hash}
+# per file. Unchanged files are detected with a stat plus a cheap
+# front-matter hash (no body read); body_hash is filename-independent,
+# which is what makes rename detection work even though the title in the
+# front matter changes with the name.
+CACHE_VERSION = 3
+
+# Per-file work is I/O-bound (reads, hashing, small writes) and the GIL
+# is released during the syscalls, so a thread pool scales it with disk
+# concurrency.
+_EXECUTOR = ThreadPoolExecutor(max_workers=min(32, (os.cpu_count() or 1) * 4))
+
+# Hot-path regexes compiled once, and a translate table that replaces the
+# chained .replace("-", " ").replace("_", " ") calls with one C-level pass
+_CHAPTER_RE = re.compile(r"chapter-(\d+)[-_ ]?(.*)\.md", re.IGNORECASE)
+_TITLE_TRANS = str.maketrans("-_", "  ")
+
 section_title_map = {
     "reading_notes": "Reading Notes",
     "meta": "Meta",
@@ -68,48 +87,216 @@ section_order_map = {
 
 def read_file_clean(path: Path) -> str:
     """Reads file content, handling BOM, and returns as UTF-8 string."""
+    return path.read_bytes().removeprefix(b"\xef\xbb\xbf").decode("utf-8")
+
+
+def read_file_bytes(path) -> bytes:
+    """Reads raw file bytes with any UTF-8 BOM stripped (no decode pass).
+
+    Takes any path-like (including os.DirEntry), so it keeps plain open()
+    rather than Path.read_bytes.
+    """
     with open(path, "rb") as f:
         raw = f.read()
-    return raw.decode("utf-8-sig")
+    return raw.removeprefix(b"\xef\xbb\xbf")
+
+
+def atomic_write(path: Path, *chunks: bytes) -> None:
+    """
+    Writes chunks to path atomically: a sibling .tmp file is written and then
+    os.replace()d over the destination, so readers (and a crashed run) only
+    ever see the old content or the complete new content, never a torn file.
+    This invariant is what lets the cache trust its own records — a recorded
+    hash can never refer to a half-written destination.
+    """
+    tmp = str(path) + ".tmp"
+    with open(tmp, "wb") as f:
+        for chunk in chunks:
+            f.write(chunk)
+    os.replace(tmp, path)
+
+
+# orjson (C-accelerated) handles the hash cache when installed; the
+# stdlib is a drop-in fallback. Both shims speak bytes so the cache file
+# is read/written with Path.read_bytes/write_bytes either way.
+try:
+    import orjson
+
+    def _json_loads(raw: bytes) -> dict:
+        return orjson.loads(raw)
+
+    def _json_dumps(data: dict) -> bytes:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+
+except ImportError:
+
+    def _json_loads(raw: bytes) -> dict:
+        return json.loads(raw)
+
+    def _json_dumps(data: dict) -> bytes:
+        return json.dumps(data, indent=2).encode("utf-8")
+
+
+# The cache hash only detects changes — a collision merely causes one
+# spurious rewrite — so a fast non-cryptographic hash is preferred when
+# available. The algorithm name is stored in the cache envelope so a
+# cache written with a different algorithm is discarded, not compared.
+try:
+    import xxhash
 
+    HASH_ALGO = "xxh3_64"
+    _new_hasher = xxhash.xxh3_64
+except ImportError:
+    HASH_ALGO = "sha256"
+    _new_hasher = hashlib.sha256
 
-def sha256(text: str) -> str:
-    """Calculates SHA256 hash of a string."""
-    return hashlib.sha256(text.encode("utf-8")).hexdigest()
 
+def content_hash(*parts: bytes) -> str:
+    """Returns a content fingerprint of the given byte chunks, fed to the
+    hasher incrementally so callers never concatenate them."""
+    h = _new_hasher()
+    for part in parts:
+        h.update(part)
+    return h.hexdigest()
 
+
+@lru_cache(maxsize=4096)
 def parse_chapter_title(filename: str):
-    """Parses filename for chapter number and title."""
-    match = re.match(r"chapter-(\d+)[-_ ]?(.*)\.md", filename, re.IGNORECASE)
+    """Parses filename for chapter number and title (memoized: called in
+    both the sync pass and the TOC pass for the same names)."""
+    match = _CHAPTER_RE.match(filename)
     if match:
         chapter_number = int(match.group(1))
-        raw_title = match.group(2).replace("-", " ").replace("_", " ").title()
+        raw_title = match.group(2).translate(_TITLE_TRANS).title()
         return chapter_number, f"Chapter {chapter_number} – {raw_title}"
-    return None, Path(filename).stem.replace("-", " ").replace("_", " ").title()
+    return None, Path(filename).stem.translate(_TITLE_TRANS).title()
 
 
 def load_hashes() -> dict:
-    """Loads file hashes from cache file."""
-    if HASH_FILE.exists():
-        with open(HASH_FILE, "r") as f:
-            return json.load(f)
-    return {}
+    """
+    Loads file hashes from cache file.
+
+    Entries are dicts {"size": int, "mtime_ns": int, "body_hash": str,
+    "fm_hash": str}. Any older cache (pre-envelope flat dict, or an
+    envelope with a different schema version or hash algorithm) is
+    discarded — its hashes are not comparable, so the next run rebuilds.
+    """
+    if not HASH_FILE.exists():
+        return {}
+    raw = _json_loads(HASH_FILE.read_bytes())
+    if raw.get("version") != CACHE_VERSION or raw.get("algo") != HASH_ALGO:
+        return {}
+    return raw["files"]
 
 
 def save_hashes(data: dict) -> None:
-    """Saves file hashes to cache file."""
-    with open(HASH_FILE, "w") as f:
-        json.dump(data, f, indent=2)
+    """Saves file hashes to cache file (versioned envelope)."""
+    HASH_FILE.write_bytes(
+        _json_dumps({"version": CACHE_VERSION, "algo": HASH_ALGO, "files": data})
+    )
 
 
+class _LazyReverseMap:
+    """
+    body_hash -> cache-key inverse of the cache, materialized on first lookup.
+
+    Rename detection is the only consumer and most runs never hit it (no
+    file changed, or the changed file is not a rename), so the O(N) pass
+    over the cache is deferred until a worker actually asks. Building it
+    twice under a thread race is harmless — both results are identical.
+    """
+
+    def __init__(self, cache: dict):
+        self._cache = cache
+        self._map = None
+
+    def get(self, body_hash: str):
+        if self._map is None:
+            self._map = {
+                v["body_hash"]: k
+                for k, v in self._cache.items()
+                if "body_hash" in v
+            }
+        return self._map.get(body_hash)
+
+
+# Destination-directory listings, one scandir per directory per run, so
+# existence probes on docs/ paths are set lookups instead of stat calls
+_DST_DIR_CACHE = {}
+
+
+def _dst_exists(path: Path) -> bool:
+    """Returns whether a destination path exists, batching the check: the
+    first probe in a directory lists it once and later probes hit the set."""
+    parent = str(path.parent)
+    names = _DST_DIR_CACHE.get(parent)
+    if names is None:
+        try:
+            with os.scandir(parent) as it:
+                names = {entry.name for entry in it}
+        except FileNotFoundError:
+            names = set()
+        _DST_DIR_CACHE[parent] = names
+    return path.name in names
+
+
+def iter_md_dirs(root: Path):
+    """
+    Yields (dirpath, md_entries) for root and every relevant subdirectory.
+
+    Scans with os.scandir so type checks reuse the dirent data the kernel
+    already returned, and prunes EXCLUDE_DIRS *before* descending —
+    os.walk would enumerate all of .git/ and docs/ first and leave the
+    filtering to the caller. md_entries are the directory's .md
+    DirEntry objects sorted by name; their cached stat feeds the
+    size/mtime fast-path without a second syscall.
+    """
+    stack = [str(root)]
+    while stack:
+        dirpath = stack.pop()
+        subdirs = []
+        md_entries = []
+        with os.scandir(dirpath) as it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    if entry.name not in EXCLUDE_DIRS:
+                        subdirs.append(entry.path)
+                elif entry.is_file(follow_symlinks=False) and entry.name.endswith(".md"):
+                    md_entries.append(entry)
+        md_entries.sort(key=lambda e: e.name)
+        yield dirpath, md_entries
+        # LIFO stack: push in reverse for sorted traversal order
+        stack.extend(sorted(subdirs, reverse=True))
+
+
+@lru_cache(maxsize=2048)
 def _natural_title_key(markdown_item: str):
     """
     Extracts the [Title] from a markdown TOC item '- [Title](file.md)'
-    and returns a list of chunks that produce a natural sort.
+    and returns a tuple of chunks that produce a natural sort (memoized:
+    the same TOC lines recur across sections within one run).
+
+    Both the bracket extraction and the digit split are plain string
+    scans — the regex engine has nothing to offer for "text between the
+    first [ and ]" or "runs of digits".
     """
-    m = re.search(r"\[(.*?)\]", markdown_item)
-    title = m.group(1) if m else markdown_item
-    return [int(t) if t.isdigit() else t.lower() for t in re.split(r"(\d+)", title)]
+    lo = markdown_item.find("[")
+    hi = markdown_item.find("]", lo + 1)
+    title = markdown_item[lo + 1 : hi] if 0 <= lo < hi else markdown_item
+
+    # One linear pass emitting alternating non-digit/digit chunks
+    key = []
+    start = 0
+    in_digits = False
+    for i, ch in enumerate(title):
+        if ch.isdigit() != in_digits:
+            chunk = title[start:i]
+            key.append(int(chunk) if in_digits else chunk.lower())
+            start = i
+            in_digits = not in_digits
+    chunk = title[start:]
+    key.append(int(chunk) if in_digits and chunk else chunk.lower())
+    return tuple(key)
 
 
 def _build_default_index_front_matter(title: str, nav_order: int, manual_toc: bool) -> str:
@@ -141,6 +328,10 @@ def create_or_update_section_index(
     chapter_links=None,
     dry_run: bool = False,
     manual_toc: bool = False,
+    cache: dict = None,
+    updated: dict = None,
+    section_dirty: bool = True,
+    ensure_dir=None,
 ) -> None:
     """
     Creates or updates the index.md file for a section.
@@ -148,14 +339,42 @@ def create_or_update_section_index(
       If an old marker exists, strip everything from the marker down.
     - If manual_toc=True: generate manual TOC with correct spacing and marker,
       add 'toc: false' in front-matter, de-duplicate & natural-sort by Title.
+    - cache/updated carry an "__index__/<rel path>" signature entry: when
+      the section's file set is unchanged this run (no write and no
+      deletion) and the previous run recorded a signature for the same
+      TOC mode, the function returns without touching the index at all
+      (no read, no compare).
+    - ensure_dir, when given, is invoked right before writing so target_dir
+      is only created if a write actually happens.
     """
     index_file = target_dir / "index.md"
+    # Keyed by relative path, not name: two same-named directories at
+    # different depths must not share one signature slot
+    index_key = f"__index__/{target_dir.relative_to(DOCS_DIR)}"
+
+    cached_sig = cache.get(index_key) if cache is not None else None
+    if (
+        not section_dirty
+        and cached_sig is not None
+        and cached_sig.get("manual_toc") == manual_toc
+    ):
+        if updated is not None:
+            updated[index_key] = cached_sig
+        print(f"📁 Index is up to date: {index_file}")
+        return
+
+    def _record(digest: str) -> None:
+        if updated is not None:
+            updated[index_key] = {"hash": digest, "manual_toc": manual_toc}
     title = section_title_map.get(target_dir.name.lower(), target_dir.name.title())
     default_content = _build_default_index_front_matter(title, nav_order, manual_toc)
 
+    # Single read (and single stat): `existing` doubles as the preserved
+    # header source and as the final written-content comparison below.
+    existing = read_file_clean(index_file) if index_file.exists() else None
+
     # Determine the preserved content above the marker (or full content if no marker)
-    if index_file.exists():
-        existing = read_file_clean(index_file)
+    if existing is not None:
         if TOC_MARKER in existing:
             content_before = existing.split(TOC_MARKER)[0].rstrip()
         else:
@@ -167,9 +386,7 @@ def create_or_update_section_index(
     # ensure we rebuild the header from the default template.
     # Detect by comparing the start of content_before to what default would produce.
     # We'll trust the default when index does not exist or when toggling manual_toc.
-    if not index_file.exists():
-        content_before = default_content.rstrip()
-    else:
+    if existing is not None:
         # If switching manual_toc mode, front-matter may need update.
         fm_prefix = _build_default_index_front_matter(title, nav_order, manual_toc)
         # If the existing header differs materially (title/nav_order/has_children/toc),
@@ -184,14 +401,16 @@ def create_or_update_section_index(
             content += "\n"
 
         # Write only if different
-        if index_file.exists():
-            existing_content = read_file_clean(index_file)
-            if existing_content == content:
-                print(f"📁 Index is up to date: {index_file}")
-                return
+        if existing == content:
+            _record(content_hash(content.encode("utf-8")))
+            print(f"📁 Index is up to date: {index_file}")
+            return
         if not dry_run:
-            with open(index_file, "w", encoding="utf-8") as f:
-                f.write(content)
+            if ensure_dir is not None:
+                ensure_dir()
+            encoded = content.encode("utf-8")
+            atomic_write(index_file, encoded)
+            _record(content_hash(encoded))
         print(f"📁 Index {'would be updated' if dry_run else 'updated'}: {index_file}")
         return
 
@@ -210,31 +429,132 @@ def create_or_update_section_index(
         + "---\n\n"
     )
 
-    content = f"{content_before}{TOC_MARKUP_STRING}"
-    if not content.endswith("\n"):
-        content += "\n"
-
-    if chapter_links:
-        # De-duplicate exact duplicates while preserving first occurrence
-        unique = list(dict.fromkeys(chapter_links))
-        # Natural sort by TITLE
-        unique_sorted = sorted(unique, key=_natural_title_key)
-        content += "\n".join(unique_sorted)
-        if not content.endswith("\n"):
-            content += "\n"
+    def _chunks():
+        """Yields the index content as encoded pieces — the full document is
+        never assembled into one string."""
+        yield content_before.encode("utf-8")
+        yield TOC_MARKUP_STRING.encode("utf-8")
+        if chapter_links:
+            # De-duplicate exact duplicates while preserving first occurrence
+            unique = list(dict.fromkeys(chapter_links))
+            # Natural sort by TITLE — decorate-sort-undecorate so each
+            # entry's key is computed exactly once
+            keyed = [(_natural_title_key(item), item) for item in unique]
+            keyed.sort()
+            for _, item in keyed:
+                yield (item + "\n").encode("utf-8")
+
+    # The "up to date" reference: the signature recorded for this mode last
+    # run when available, else the hash of what is on disk right now.
+    if cached_sig is not None and cached_sig.get("manual_toc") == manual_toc:
+        ref_digest = cached_sig.get("hash")
+    elif existing is not None:
+        ref_digest = content_hash(existing.encode("utf-8"))
+    else:
+        ref_digest = None
 
-    # Write only if different
-    if index_file.exists():
-        existing_content = read_file_clean(index_file)
-        if existing_content == content:
+    if dry_run:
+        digest = content_hash(*_chunks())
+        if digest == ref_digest:
             print(f"📁 Index is up to date: {index_file}")
-            return
+        else:
+            print(f"📁 Index would be updated: {index_file}")
+        return
 
-    if not dry_run:
-        with open(index_file, "w", encoding="utf-8") as f:
-            f.write(content)
+    # Stream to the temp file while hashing the same chunks; if the running
+    # hash matches what is already there, the temp file is simply dropped.
+    if ensure_dir is not None:
+        ensure_dir()
+    tmp = str(index_file) + ".tmp"
+    hasher = _new_hasher()
+    with open(tmp, "wb") as f:
+        for chunk in _chunks():
+            hasher.update(chunk)
+            f.write(chunk)
+    digest = hasher.hexdigest()
+
+    _record(digest)
+    if digest == ref_digest:
+        os.unlink(tmp)
+        print(f"📁 Index is up to date: {index_file}")
+        return
+
+    os.replace(tmp, index_file)
+    print(f"📁 Index updated: {index_file}")
 
-    print(f"📁 Index {'would be updated' if dry_run else 'updated'}: {index_file}")
+
+def _make_fm_builder(section_title):
+    """
+    Returns a (title, nav_order) -> front-matter-bytes function specialized
+    for one section. The parent line and the branch on section_title are
+    resolved once here instead of once per file in the inner loop.
+    """
+    if section_title:
+        def make_fm(title: str, nav_order: int) -> bytes:
+            return (
+                f'---\ntitle: "{title}"\nparent: {section_title}\n'
+                f"nav_order: {nav_order}\n---\n\n"
+            ).encode("utf-8")
+    else:
+        def make_fm(title: str, nav_order: int) -> bytes:
+            return (
+                f'---\ntitle: "{title}"\nnav_order: {nav_order}\n---\n\n'
+            ).encode("utf-8")
+    return make_fm
+
+
+def _process_file(src_file, hash_key, fname, fallback_nav_order, make_fm, cache, reverse_hash_map):
+    """
+    Per-file worker: stat fast-path, front matter build, read and hash.
+
+    src_file may be an os.DirEntry, whose cached stat avoids a syscall.
+    Touches no shared state, so it is safe to run on the thread pool; the
+    caller applies renames/writes and merges results serially.
+    Returns (cache_entry, write_payload_or_None, old_path_or_None).
+    """
+    # Front matter is derived from the filename and section alone, so its
+    # hash is computed before (and often instead of) any body read.
+    chapter_num, title = parse_chapter_title(fname)
+    nav_order_entry = chapter_num if chapter_num else fallback_nav_order
+    fm_bytes = make_fm(title, nav_order_entry)
+    fm_hash = content_hash(fm_bytes)
+
+    st = src_file.stat()
+    cached = cache.get(hash_key)
+    if (
+        cached is not None
+        and cached.get("size") == st.st_size
+        and cached.get("mtime_ns") == st.st_mtime_ns
+        and cached.get("fm_hash") == fm_hash
+    ):
+        return cached, None, None
+
+    # Raw bytes all the way: fingerprinting needs no decoded text,
+    # and the output is UTF-8 regardless.
+    body = read_file_bytes(src_file)
+    body_hash = content_hash(body)
+    new_entry = {
+        "size": st.st_size,
+        "mtime_ns": st.st_mtime_ns,
+        "body_hash": body_hash,
+        "fm_hash": fm_hash,
+    }
+
+    if (
+        cached is not None
+        and cached.get("body_hash") == body_hash
+        and cached.get("fm_hash") == fm_hash
+    ):
+        return new_entry, None, None
+
+    # A front-matter-only change maps the body hash back to this same key,
+    # and a new file may simply duplicate a surviving note's body — it is
+    # only a rename if the key differs *and* the old source file is gone.
+    old_key = reverse_hash_map.get(body_hash)
+    old_path = None
+    if old_key and old_key != hash_key and not (SOURCE_DIR / old_key).exists():
+        old_path = DOCS_DIR / old_key
+    return new_entry, (fm_bytes, body), old_path
 
 
 def sync_notes(dry_run: bool = False, clean: bool = False, manual_toc: bool = False) -> None:
@@ -247,19 +567,36 @@ def sync_notes(dry_run: bool = False, clean: bool = False, manual_toc: bool = Fa
     cache = load_hashes()
     updated = {}
     any_synced = False
-    reverse_hash_map = {v: k for k, v in cache.items()}
+    reverse_hash_map = _LazyReverseMap(cache)
 
-    for root, _, files in os.walk(SOURCE_DIR):
-        rel = Path(root).relative_to(SOURCE_DIR)
-        if any(p in EXCLUDE_DIRS for p in rel.parts):
-            continue
+    # Cache keys grouped by directory, so each section can tell whether a
+    # previously-synced file has disappeared — a deletion never writes,
+    # so it would otherwise never dirty its section's index.
+    cached_keys_by_dir = {}
+    for k in cache:
+        if not k.startswith("__index__/"):
+            cached_keys_by_dir.setdefault(os.path.dirname(k), set()).add(k)
+
+    src_prefix = str(SOURCE_DIR)
 
-        md_files = sorted(f for f in files if f.endswith(".md"))
-        if not md_files:
+    for root, md_entries in iter_md_dirs(SOURCE_DIR):
+        if not md_entries:
             continue
 
+        rel = Path(root).relative_to(SOURCE_DIR)
+
         target_dir = DOCS_DIR / rel
-        target_dir.mkdir(parents=True, exist_ok=True)
+
+        # Deferred until something actually needs writing: on a steady-state
+        # run no section pays the mkdir syscall at all.
+        dir_ready = False
+
+        def ensure_dir(target_dir=target_dir):
+            nonlocal dir_ready
+            if not dir_ready:
+                target_dir.mkdir(parents=True, exist_ok=True)
+                dir_ready = True
+
 
         section_name = rel.name if rel.parts else None
         nav_order = section_order_map.get(section_name.lower(), 90) if section_name else 1
@@ -270,50 +607,71 @@ def sync_notes(dry_run: bool = False, clean: bool = False, manual_toc: bool = Fa
         )
 
         # --- File Sync Pass ---
-        for i, fname in enumerate(md_files):
+        # Fan the independent read/hash work out to the pool; futures are
+        # drained in submit order, so rename deletions, writes, and the
+        # `updated` merge stay serial and deterministic.
+        make_fm = _make_fm_builder(section_title)
+        futures = []
+        for i, entry in enumerate(md_entries):
+            fname = entry.name
             if fname.lower() == "index.md":
                 continue
 
-            src_file = Path(root) / fname
-            dst_file = target_dir / fname
-            body = read_file_clean(src_file)
-
-            chapter_num, title = parse_chapter_title(fname)
-            nav_order_entry = chapter_num if chapter_num else (i + 1)
-
-            front_matter = f'---\ntitle: "{title}"\n'
-            if section_title:
-                front_matter += f"parent: {section_title}\n"
-            front_matter += f"nav_order: {nav_order_entry}\n---\n\n"
-
-            final = front_matter + body
-            file_hash = sha256(final)
-            hash_key = str(src_file.relative_to(SOURCE_DIR))
-            updated[hash_key] = file_hash
-
-            if cache.get(hash_key) != file_hash:
-                if file_hash in reverse_hash_map:
-                    old_key = reverse_hash_map[file_hash]
-                    old_path = DOCS_DIR / old_key
-                    if old_path.exists():
-                        if not dry_run:
-                            old_path.unlink()
-                        print(f"🔄 Renamed (deleted old): {old_path}")
-
-                if not dry_run:
-                    with open(dst_file, "w", encoding="utf-8") as f:
-                        f.write(final)
-                print(f"{'📝 Would sync' if dry_run else '✅ Synced'}: {dst_file}")
-                any_synced = True
+            hash_key = entry.path[len(src_prefix) + 1 :]
+            futures.append(
+                (
+                    fname,
+                    hash_key,
+                    _EXECUTOR.submit(
+                        _process_file,
+                        entry,
+                        hash_key,
+                        fname,
+                        i + 1,
+                        make_fm,
+                        cache,
+                        reverse_hash_map,
+                    ),
+                )
+            )
 
-        # --- Index generation ---
         chapter_links = []
-        for fname in md_files:
-            if fname.lower() == "index.md":
+        # Dirty from the start if a cached file of this directory is gone
+        # from the current file set (its TOC entry must be dropped)
+        run_keys = {hash_key for _, hash_key, _ in futures}
+        section_dirty = not cached_keys_by_dir.get(str(rel), set()) <= run_keys
+        for fname, hash_key, future in futures:
+            # Chapter link built here so md_entries is walked only once
+            # (memoized title parse)
+            _, link_title = parse_chapter_title(fname)
+            chapter_links.append(f"- [{link_title}]({fname})")
+
+            cache_entry, payload, old_path = future.result()
+            updated[hash_key] = cache_entry
+
+            if payload is None:
                 continue
-            _, title = parse_chapter_title(fname)
-            chapter_links.append(f"- [{title}]({fname})")
 
+            if old_path is not None and _dst_exists(old_path):
+                if not dry_run:
+                    old_path.unlink()
+                    # Keep the cached listing honest: another worker in
+                    # this drain may resolve the same old_path
+                    _DST_DIR_CACHE[str(old_path.parent)].discard(old_path.name)
+                print(f"🔄 Renamed (deleted old): {old_path}")
+
+            dst_file = target_dir / fname
+            if not dry_run:
+                ensure_dir()
+                # Two chunks — the front matter + body concatenation is
+                # never materialized
+                fm_bytes, body = payload
+                atomic_write(dst_file, fm_bytes, body)
+            print(f"{'📝 Would sync' if dry_run else '✅ Synced'}: {dst_file}")
+            any_synced = True
+            section_dirty = True
+
+        # --- Index generation ---
         if section_title:
             create_or_update_section_index(
                 target_dir,
@@ -321,6 +679,10 @@ def sync_notes(dry_run: bool = False, clean: bool = False, manual_toc: bool = Fa
                 chapter_links=chapter_links,
                 dry_run=dry_run,
                 manual_toc=manual_toc,
+                cache=cache,
+                updated=updated,
+                section_dirty=section_dirty,
+                ensure_dir=ensure_dir,
             )
 
     if not dry_run:
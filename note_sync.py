@@ -21,6 +21,10 @@ import hashlib
 import json
 import re
 import argparse
+from concurrent.futures import ThreadPoolExecutor
+from collections import namedtuple
+from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional, Tuple, Dict, List
 
@@ -32,6 +36,32 @@ EXCLUDE_DIRS = {"docs", ".git", "__pycache__"}
 # Manual TOC marker used when we inject a custom list
 TOC_MARKER = "<!-- TOC:DO-NOT-EDIT -->"
 
+# Per-file work (stat, read, hash) is I/O-bound and releases the GIL in
+# the syscalls, so a thread pool scales it with disk concurrency
+_EXECUTOR = ThreadPoolExecutor(max_workers=min(32, (os.cpu_count() or 1) * 4))
+
+# Hot-path regexes compiled once instead of re-consulting re's internal
+# cache (a dict lookup plus a call) on every invocation
+_CHAPTER_RE = re.compile(r"chapter[-_ ]?(\d+)[-_ ]?(.*?)\.md$", re.IGNORECASE)
+_DIGIT_SPLIT_RE = re.compile(r"(\d+)")
+_PREFIX_RE = re.compile(r"^\s*(\d+)[-_ ]+(.*)$")
+_FM_LINE_RE = re.compile(r"^([^:\n]+):[ \t]*(.*)$", re.MULTILINE)
+
+# Directory-title helpers: the acronym set and the dash/underscore
+# translation table are built once instead of per clean_dir_title call
+_ACRONYMS = frozenset(
+    {"aws", "iam", "cpu", "gpu", "api", "ssl", "tls", "url", "http", "https", "dns"}
+)
+_DASH_TRANS = str.maketrans("-_", "  ")
+
+# Compact per-file cache record: a tuple costs a fraction of a dict per
+# entry and compares in one C-level operation. The fingerprint is split —
+# body_hash covers the raw source bytes, fm_hash the generated front
+# matter — so a taxonomy change (titles, nav order) never forces a
+# re-read of unchanged bodies, and body_hash identifies renamed files
+# independently of their filename-derived front matter.
+CacheEntry = namedtuple("CacheEntry", "size mtime_ns body_hash fm_hash")
+
 # Top-level section configuration
 section_title_map = {
     "reading_notes": "Reading Notes",
@@ -52,16 +82,73 @@ section_order_map = {
 }
 
 
-def read_file_clean(path: Path) -> str:
-    """Reads file content, handling BOM, and returns as UTF-8 string."""
+def read_file_bytes(path: Path) -> bytes:
+    """Reads raw file bytes with any UTF-8 BOM stripped (no decode pass)."""
     with open(path, "rb") as f:
         raw = f.read()
-    return raw.decode("utf-8-sig")
+    return raw.removeprefix(b"\xef\xbb\xbf")
+
+
+def read_file_clean(path: Path) -> str:
+    """Reads file content, handling BOM, and returns as UTF-8 string."""
+    return read_file_bytes(path).decode("utf-8")
+
+
+def atomic_write(path: Path, *chunks: bytes) -> None:
+    """
+    Writes chunks to path atomically: a sibling .tmp file is written and
+    then os.replace()d over the destination, so a crash mid-write can
+    never leave a half-written page for Just the Docs to build.
+    """
+    tmp = str(path) + ".tmp"
+    with open(tmp, "wb") as f:
+        for chunk in chunks:
+            f.write(chunk)
+    os.replace(tmp, path)
+
 
+# orjson (C-accelerated) handles the hash cache when installed; the
+# stdlib is a drop-in fallback. Both shims speak bytes so the cache file
+# is read/written with Path.read_bytes/write_bytes either way.
+try:
+    import orjson
 
-def sha256(text: str) -> str:
-    """Calculates SHA256 hash of a string."""
-    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+    def _json_loads(raw: bytes) -> dict:
+        return orjson.loads(raw)
+
+    def _json_dumps(data: dict) -> bytes:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+
+except ImportError:
+
+    def _json_loads(raw: bytes) -> dict:
+        return json.loads(raw)
+
+    def _json_dumps(data: dict) -> bytes:
+        return json.dumps(data, indent=2).encode("utf-8")
+
+
+# The cache hash is change detection, not integrity — a collision merely
+# costs one spurious rewrite — so a fast non-cryptographic hash is used
+# when available. Digests carry an algorithm prefix, so entries written
+# with a different algorithm simply never match and are recomputed once.
+try:
+    import xxhash
+
+    _new_hasher = xxhash.xxh3_128
+    _HASH_PREFIX = "xxh3:"
+except ImportError:
+    _new_hasher = hashlib.sha256
+    _HASH_PREFIX = "sha256:"
+
+
+def content_hash(*parts: bytes) -> str:
+    """Prefixed content fingerprint of the given byte chunks, fed to the
+    hasher incrementally so callers never concatenate them."""
+    h = _new_hasher()
+    for part in parts:
+        h.update(part)
+    return _HASH_PREFIX + h.hexdigest()
 
 
 def parse_chapter_title(filename: str) -> Tuple[Optional[int], str]:
@@ -70,7 +157,7 @@ def parse_chapter_title(filename: str) -> Tuple[Optional[int], str]:
     if filename.lower() == "readme.md":
         return None, "README"
 
-    match = re.match(r"chapter[-_ ]?(\d+)[-_ ]?(.*?)\.md$", filename, re.IGNORECASE)
+    match = _CHAPTER_RE.match(filename)
     if match:
         chapter_number = int(match.group(1))
         raw_title = match.group(2).replace("-", " ").replace("_", " ").strip()
@@ -83,52 +170,92 @@ def parse_chapter_title(filename: str) -> Tuple[Optional[int], str]:
 
 
 def load_hashes() -> dict:
-    """Loads file hashes from cache file."""
-    if HASH_FILE.exists():
-        with open(HASH_FILE, "r") as f:
-            return json.load(f)
-    return {}
+    """
+    Loads file hashes from cache file.
+
+    Entries are CacheEntry tuples (size, mtime_ns, body_hash, fm_hash),
+    serialized as 4-element lists, so an unchanged file is recognized
+    from a single stat() without re-reading or re-hashing it. Hash
+    values carry an algorithm prefix (see content_hash). Older formats —
+    combined-hash lists, bare hash strings, dicts — predate the split
+    fingerprint and can never match either hash, so they are dropped at
+    the cost of at most one recompute per file.
+    """
+    if not HASH_FILE.exists():
+        return {}
+    raw = _json_loads(HASH_FILE.read_bytes())
+    return {
+        k: CacheEntry(*v)
+        for k, v in raw.items()
+        if isinstance(v, list) and len(v) == 4
+    }
 
 
 def save_hashes(data: dict) -> None:
-    """Saves file hashes to cache file."""
-    with open(HASH_FILE, "w") as f:
-        json.dump(data, f, indent=2)
+    """Saves file hashes to cache file (CacheEntry tuples as lists)."""
+    HASH_FILE.write_bytes(_json_dumps({k: list(v) for k, v in data.items()}))
 
 
-def _natural_title_key(markdown_item: str):
+class _LazyReverseMap:
     """
-    Extracts the [Title] from a markdown TOC item '- [Title](file.md)'
-    and returns a list of chunks that produce a natural sort.
+    body_hash -> cache-key inverse of the cache, materialized on first lookup.
+
+    Only rename detection consumes it, and most runs never get that far
+    (nothing changed, or the change is not a rename), so the O(N) pass
+    over the cache is deferred until a worker actually asks. Building it
+    twice under a thread race is harmless — both results are identical.
     """
-    m = re.search(r"\[(.*?)\]", markdown_item)
-    title = m.group(1) if m else markdown_item
-    return [int(t) if t.isdigit() else t.lower() for t in re.split(r"(\d+)", title)]
+
+    def __init__(self, cache: dict):
+        self._cache = cache
+        self._map = None
+
+    def get(self, body_hash: str):
+        if self._map is None:
+            self._map = {
+                v.body_hash: k for k, v in self._cache.items() if v.body_hash
+            }
+        return self._map.get(body_hash)
+
+
+def _natural_title_key_from_title(title: str):
+    """Returns a list of chunks that produce a natural sort for a title."""
+    return [int(t) if t.isdigit() else t.lower() for t in _DIGIT_SPLIT_RE.split(title)]
 
 
 def _extract_front_matter(content: str) -> Tuple[Dict, bool]:
     """
     Extracts front matter from content.
     Returns (front_matter_dict, has_valid_fm).
+
+    Only the region up to the closing '---' fence is ever sliced, so the
+    cost is O(front-matter size) — the body is never copied or scanned.
+    The key/value split is one C-level regex scan instead of a
+    split/strip chain per line.
     """
-    if not content.strip().startswith("---"):
+    if not content.startswith("---"):
         return {}, False
 
-    parts = content.split("---", 2)
-    if len(parts) < 3:
+    end = content.find("\n---", 3)
+    if end < 0:
         return {}, False
 
-    fm_dict = {}
-    for line in parts[1].strip().split("\n"):
-        if ":" in line:
-            key, value = line.split(":", 1)
-            fm_dict[key.strip()] = value.strip()
-
-    return fm_dict, True
+    return {
+        m.group(1).strip(): m.group(2).strip()
+        for m in _FM_LINE_RE.finditer(content[3:end])
+    }, True
 
 
+@lru_cache(maxsize=None)
 def get_existing_title_for_dir(rel_path: Path) -> Optional[str]:
-    """Return the exact 'title' from docs/<rel>/index.md, if present."""
+    """Return the exact 'title' from docs/<rel>/index.md, if present.
+
+    Memoized for the run: every directory's title is asked for once per
+    child (plus once per index regeneration), so caching turns O(N·depth)
+    stat+read+parse work into one read per directory. sync_notes clears
+    the cache on entry, and the pre-order walk guarantees a directory's
+    index is written before any child asks for its title.
+    """
     idx = DOCS_DIR / rel_path / "index.md"
     if idx.exists():
         try:
@@ -147,7 +274,7 @@ def get_existing_title_for_dir(rel_path: Path) -> Optional[str]:
 
 def _split_numeric_prefix(name: str) -> Tuple[Optional[int], str]:
     """If name starts with '01-', return (1, 'rest'); else (None, name)."""
-    m = re.match(r"^\s*(\d+)[-_ ]+(.*)$", name)
+    m = _PREFIX_RE.match(name)
     if m:
         return int(m.group(1)), m.group(2)
     return None, name
@@ -172,53 +299,107 @@ def clean_dir_title(dir_name: str, parent_title: Optional[str]) -> Tuple[str, in
         if visible.lower().startswith(norm_parent + " - "):
             visible = visible[len(parent_title) + 3 :].lstrip()
 
-    visible = visible.replace("-", " ").replace("_", " ").strip()
+    visible = visible.translate(_DASH_TRANS).strip()
 
     def smart_title(s: str) -> str:
-        parts = s.split()
-        acronyms = {
-            "aws",
-            "iam",
-            "cpu",
-            "gpu",
-            "api",
-            "ssl",
-            "tls",
-            "url",
-            "http",
-            "https",
-            "dns",
-        }
-        out = []
-        for p in parts:
-            out.append(p.upper() if p.lower() in acronyms else p.capitalize())
-        return " ".join(out) if out else s
+        return " ".join(
+            p.upper() if p.lower() in _ACRONYMS else p.capitalize() for p in s.split()
+        )
 
     title = smart_title(visible) if visible else "Untitled"
     return title, nav
 
 
-def has_markdown_files_recursive(directory: Path) -> bool:
-    """Check if a directory or any of its subdirectories contain markdown files (excludes index.md)."""
-    for root, _, files in os.walk(directory):
-        if any(f.endswith(".md") and f.lower() != "index.md" for f in files):
-            return True
-    return False
+def _iter_dirs(root: Path, exclude: Optional[set] = None):
+    """
+    Yields (dirpath, dirnames, filenames) like os.walk, but via os.scandir
+    so entry types come from the dirent data the kernel already returned
+    instead of one stat() per entry. Traversal is depth-first pre-order
+    with sorted children, so parents are always yielded before children
+    and the order is deterministic.
+
+    Directories named in `exclude` are pruned *before* descent, so their
+    subtrees (e.g. all of .git/ or the mirrored docs/) are never entered
+    at all rather than being walked and skipped afterwards.
+    """
+    stack = [str(root)]
+    while stack:
+        dirpath = stack.pop()
+        dirnames = []
+        filenames = []
+        try:
+            with os.scandir(dirpath) as it:
+                for entry in it:
+                    if entry.is_dir(follow_symlinks=False):
+                        if exclude is None or entry.name not in exclude:
+                            dirnames.append(entry.name)
+                    else:
+                        filenames.append(entry.name)
+        except (FileNotFoundError, NotADirectoryError):
+            continue
+        yield dirpath, dirnames, filenames
+        # LIFO stack: push in reverse for sorted traversal order
+        stack.extend(
+            os.path.join(dirpath, d) for d in sorted(dirnames, reverse=True)
+        )
+
 
+@dataclass
+class TreeNode:
+    """Everything the sync pass needs to know about one source directory."""
 
-def has_child_dir_with_markdown(rel_path: Path) -> bool:
+    md_files: List[str]  # direct .md files, sorted, index.md excluded
+    has_md_recursive: bool  # any non-index .md anywhere in this subtree
+    child_dirs_with_md: List[Path]  # immediate children whose subtree has md
+
+
+def scan_tree(
+    root: Path, exclude: Optional[set] = None
+) -> Tuple[List[Path], Dict[Path, TreeNode]]:
     """
-    Return True if rel_path has at least one *immediate* child directory that (recursively)
-    contains markdown files. Resource-only folders do NOT count.
+    Single post-order scandir pass over the tree.
+
+    Returns (order, nodes): `order` lists every non-excluded directory in
+    depth-first pre-order (parents before children, sorted siblings) and
+    `nodes` maps each directory to its TreeNode. The subtree predicates
+    the main loop needs ("any markdown below here?", "which children carry
+    markdown?") are answered by dict lookups afterwards, so no directory
+    is ever enumerated twice per run.
     """
-    src_dir = SOURCE_DIR / rel_path
-    if not src_dir.exists() or not src_dir.is_dir():
-        return False
-    for child in src_dir.iterdir():
-        if child.is_dir() and child.name not in EXCLUDE_DIRS:
-            if has_markdown_files_recursive(child):
-                return True
-    return False
+    order: List[Path] = []
+    nodes: Dict[Path, TreeNode] = {}
+
+    def _scan(dirpath: str) -> Optional[TreeNode]:
+        path = Path(dirpath)
+        order.append(path)
+        md_files = []
+        child_paths = []
+        try:
+            with os.scandir(dirpath) as it:
+                for entry in it:
+                    if entry.is_dir(follow_symlinks=False):
+                        if exclude is None or entry.name not in exclude:
+                            child_paths.append(entry.path)
+                    elif entry.name.endswith(".md") and entry.name.lower() != "index.md":
+                        md_files.append(entry.name)
+        except (FileNotFoundError, NotADirectoryError):
+            order.pop()
+            return None
+
+        has_md = bool(md_files)
+        child_dirs_with_md = []
+        for child in sorted(child_paths):
+            child_node = _scan(child)
+            if child_node is not None and child_node.has_md_recursive:
+                child_dirs_with_md.append(Path(child))
+                has_md = True
+
+        node = TreeNode(sorted(md_files), has_md, child_dirs_with_md)
+        nodes[path] = node
+        return node
+
+    _scan(str(root))
+    return order, nodes
 
 
 def _build_index_front_matter(
@@ -249,13 +430,19 @@ def create_or_update_index(
     target_dir: Path,
     rel_path: Path,
     nav_order: int,
-    toc_lines: Optional[List[str]] = None,
+    toc_lines: Optional[List[Tuple[list, str]]] = None,
     dry_run: bool = False,
+    has_subdirs: bool = False,
+    ensure_dir=None,
 ) -> None:
     """
     Create or update the index.md file for a directory with optional inline TOC.
-    - If toc_lines is provided, inject a manual TOC section and set 'toc: false' to suppress built-in TOC.
-    - has_children is set based on whether this directory has subdirectories with markdown files.
+    - If toc_lines is provided — (natural_sort_key, markdown_line) pairs — inject
+      a manual TOC section and set 'toc: false' to suppress built-in TOC.
+    - has_subdirs (from the caller's scan_tree pass) says whether this directory
+      has child directories with markdown; it drives 'has_children'.
+    - ensure_dir, when given, is invoked right before writing so target_dir
+      is only created if a write actually happens.
     """
     index_file = target_dir / "index.md"
 
@@ -282,9 +469,6 @@ def create_or_update_index(
 
         dir_name, _ = clean_dir_title(rel_path.name, parent_title_for_this_index)
 
-    # Check if this directory has child directories with markdown
-    has_subdirs = has_child_dir_with_markdown(rel_path)
-
     # Determine whether to suppress built-in TOC
     toc_false = toc_lines is not None and len(toc_lines) > 0
 
@@ -329,10 +513,10 @@ def create_or_update_index(
                 if non_toc_lines:
                     content_before += "\n".join(non_toc_lines) + "\n"
 
-    # Inject manual TOC if provided
+    # Inject manual TOC if provided — decorate-sort-undecorate: the keys
+    # were computed once at the caller, so the sort never calls back out
     if toc_lines:
-        sorted_toc = sorted(toc_lines, key=_natural_title_key)
-        toc_md = "\n".join(sorted_toc)
+        toc_md = "\n".join(line for _, line in sorted(toc_lines))
         content = f"{content_before}{TOC_MARKER}\n\n{toc_md}\n"
         if not content.endswith("\n"):
             content += "\n"
@@ -341,79 +525,204 @@ def create_or_update_index(
         if not content.endswith("\n"):
             content += "\n"
 
-    # Write only if changed
-    if index_file.exists():
-        existing_content = read_file_clean(index_file)
-        if existing_content == content:
-            print(f"📄 Index is up to date: {index_file}")
-            return
+    # Write only if changed — encode once, compare and write the bytes
+    content_bytes = content.encode("utf-8")
+    if index_file.exists() and read_file_bytes(index_file) == content_bytes:
+        print(f"📄 Index is up to date: {index_file}")
+        return
 
     if not dry_run:
-        with open(index_file, "w", encoding="utf-8") as f:
-            f.write(content)
+        if ensure_dir is not None:
+            ensure_dir()
+        atomic_write(index_file, content_bytes)
 
     print(f"📝 Index {'would be updated' if dry_run else 'updated'}: {index_file}")
 
 
-def clean_orphaned_files(updated: dict, dry_run: bool = False) -> int:
-    """Remove files/dirs in docs/ that no longer exist in source. Return count removed."""
-    orphaned_count = 0
+def clean_orphaned_files(
+    updated: dict,
+    dry_run: bool = False,
+    source_tree: Optional[Dict[Path, TreeNode]] = None,
+) -> int:
+    """
+    Remove files/dirs in docs/ that no longer exist in source. Return count removed.
+
+    A single post-order scandir pass handles both jobs: each directory
+    cleans its children first, drops its own orphaned files, then reports
+    back whether the caller should remove the directory itself — so dead
+    subtrees disappear children-before-parent in one walk. source_tree,
+    when given, is the scan_tree result for SOURCE_DIR so the "does the
+    source still have markdown here?" question is a dict lookup instead
+    of a walk per docs directory.
+    """
+    removed = 0
 
-    # Orphaned files
-    for root, _, files in os.walk(DOCS_DIR):
-        for fname in files:
-            if not fname.endswith(".md"):
-                continue
-            doc_file = Path(root) / fname
-            rel_path = doc_file.relative_to(DOCS_DIR)
-            if fname == "index.md":
-                continue
-            src_file = SOURCE_DIR / rel_path
-            hash_key = str(rel_path)
-            if not src_file.exists() and hash_key not in updated:
-                if not dry_run:
-                    doc_file.unlink()
-                print(
-                    f"🗑️  {'Would remove' if dry_run else 'Removed'} orphaned file: {doc_file}"
-                )
-                orphaned_count += 1
+    # Inside docs/ only VCS/tooling noise needs pruning, not "docs" itself
+    docs_exclude = EXCLUDE_DIRS - {"docs"}
 
-    # Empty dirs (or dirs with only empty content)
-    for root, _, _ in os.walk(DOCS_DIR, topdown=False):
-        root_path = Path(root)
-        if root_path == DOCS_DIR:
-            continue
-        rel_path = root_path.relative_to(DOCS_DIR)
+    def _src_has_md(src_dir: Path) -> bool:
+        if source_tree is not None:
+            node = source_tree.get(src_dir)
+            return node.has_md_recursive if node is not None else False
+        for _, _, files in _iter_dirs(src_dir, exclude=EXCLUDE_DIRS):
+            if any(f.endswith(".md") for f in files):
+                return True
+        return False
+
+    def _clean_recursive(doc_dir: Path) -> bool:
+        """Clean doc_dir's subtree; return True if the caller should remove it."""
+        nonlocal removed
+        rel_path = doc_dir.relative_to(DOCS_DIR)
         src_dir = SOURCE_DIR / rel_path
+        orphan_dir = doc_dir != DOCS_DIR and (
+            not src_dir.exists() or not _src_has_md(src_dir)
+        )
 
-        has_md_files = False
-        if src_dir.exists():
-            for r, _, fl in os.walk(src_dir):
-                if any(f.endswith(".md") for f in fl):
-                    has_md_files = True
-                    break
+        try:
+            entries = list(os.scandir(doc_dir))
+        except OSError:
+            return False
+
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                if entry.name in docs_exclude:
+                    continue
+                child = doc_dir / entry.name
+                if _clean_recursive(child):
+                    try:
+                        if not dry_run:
+                            child.rmdir()
+                        print(
+                            f"🗑️  {'Would remove' if dry_run else 'Removed'} empty directory: {child}"
+                        )
+                        removed += 1
+                    except OSError:
+                        pass
+            elif entry.is_file(follow_symlinks=False):
+                fname = entry.name
+                if fname.endswith(".md") and fname != "index.md":
+                    if (
+                        not (src_dir / fname).exists()
+                        and str(rel_path / fname) not in updated
+                    ):
+                        if not dry_run:
+                            os.unlink(entry.path)
+                        print(
+                            f"🗑️  {'Would remove' if dry_run else 'Removed'} orphaned file: {doc_dir / fname}"
+                        )
+                        removed += 1
+                        continue
+                if orphan_dir and not dry_run:
+                    # Directory is dead in source: remaining files
+                    # (index.md included) go with it.
+                    os.unlink(entry.path)
+
+        return orphan_dir
+
+    if DOCS_DIR.exists():
+        _clean_recursive(DOCS_DIR)
+    return removed
+
+
+def _sync_one(
+    src_file: Path,
+    hash_key: str,
+    fname: str,
+    fallback_nav_order: int,
+    parent_title: Optional[str],
+    exclude_from_nav: bool,
+    cache: dict,
+    reverse_hash_map: "_LazyReverseMap",
+) -> Tuple[dict, Optional[str], Optional[Path]]:
+    """
+    Per-file worker: stat fast-path, front matter build, read and hash.
 
-        if not src_dir.exists() or not has_md_files:
-            try:
-                if not dry_run:
-                    for f in root_path.glob("*"):
-                        if f.is_file():
-                            f.unlink()
-                    root_path.rmdir()
-                print(
-                    f"🗑️  {'Would remove' if dry_run else 'Removed'} empty directory: {root_path}"
-                )
-                orphaned_count += 1
-            except OSError:
-                pass
+    Touches no shared state and performs no writes, so it is safe to run
+    on the thread pool; the caller applies deletions/writes and merges the
+    results serially. Returns (cache_entry, payload_or_None, old_path_or_
+    None) where payload is (front_matter_bytes, body_bytes) — a None
+    payload means the file is unchanged.
+    """
+    chapter_num, title = parse_chapter_title(fname)
+    nav_order_entry = chapter_num if chapter_num is not None else fallback_nav_order
 
-    return orphaned_count
+    front_matter = f'---\ntitle: "{title}"\n'
+
+    # KEY FIX: Only set parent if file is NOT excluded from nav
+    # When nav_exclude is true, parent causes issues in Just the Docs
+    if exclude_from_nav:
+        # Excluded from nav - don't set parent, just exclude
+        front_matter += "nav_exclude: true\n"
+    else:
+        # Visible in nav - set parent and nav_order
+        if parent_title:
+            front_matter += f"parent: {parent_title}\n"
+        front_matter += f"nav_order: {nav_order_entry}\n"
+
+    front_matter += "---\n\n"
+
+    # Front matter derives from the filename and section alone, so its
+    # hash is ready before (and often instead of) any body read
+    fm_bytes = front_matter.encode("utf-8")
+    fm_hash = content_hash(fm_bytes)
+
+    # Stat fast-path: same size/mtime means the body is unchanged, and a
+    # matching fm_hash means the output would be byte-identical — skip
+    # the read and the hash entirely
+    st = src_file.stat()
+    cached_entry = cache.get(hash_key)
+    if (
+        cached_entry is not None
+        and cached_entry.size == st.st_size
+        and cached_entry.mtime_ns == st.st_mtime_ns
+        and cached_entry.fm_hash == fm_hash
+    ):
+        return cached_entry, None, None
+
+    # Raw bytes all the way: the hash needs no decoded text and the
+    # output is UTF-8 regardless
+    body = read_file_bytes(src_file)
+    body_hash = content_hash(body)
+    new_entry = CacheEntry(st.st_size, st.st_mtime_ns, body_hash, fm_hash)
+
+    if (
+        cached_entry is not None
+        and cached_entry.body_hash == body_hash
+        and cached_entry.fm_hash == fm_hash
+    ):
+        return new_entry, None, None
+
+    # The cache said "changed", but the destination may already hold the
+    # right bytes (e.g. after --clean or a hand-edited cache file). A
+    # cheap size probe gates the full compare; skipping the rewrite saves
+    # the write and leaves the destination mtime untouched.
+    dst_file = DOCS_DIR / hash_key
+    try:
+        if os.stat(dst_file).st_size == len(fm_bytes) + len(body):
+            with open(dst_file, "rb") as f:
+                existing = f.read()
+            if existing[: len(fm_bytes)] == fm_bytes and existing[len(fm_bytes):] == body:
+                return new_entry, None, None
+    except OSError:
+        pass
+
+    # A front-matter-only change maps the body hash back to this same
+    # key, and a new file may simply duplicate a surviving note's body —
+    # it is only a rename if the key differs *and* the old source is gone
+    old_key = reverse_hash_map.get(body_hash)
+    old_path = None
+    if old_key and old_key != hash_key and not (SOURCE_DIR / old_key).exists():
+        old_path = DOCS_DIR / old_key
+    return new_entry, (fm_bytes, body), old_path
 
 
 def sync_notes(dry_run: bool = False, clean: bool = False) -> None:
     """Sync notes with nested directory support and smart TOC generation."""
     stats = {"synced": 0, "renamed": 0, "orphaned": 0, "unchanged": 0, "indexes": 0}
 
+    # Titles cached from docs/ index files must not leak across runs
+    get_existing_title_for_dir.cache_clear()
+
     if clean and HASH_FILE.exists():
         if not dry_run:
             HASH_FILE.unlink()
@@ -423,27 +732,23 @@ def sync_notes(dry_run: bool = False, clean: bool = False) -> None:
 
     cache = load_hashes()
     updated = {}
-    reverse_hash_map = {v: k for k, v in cache.items()}
+    reverse_hash_map = _LazyReverseMap(cache)
 
     print("\n" + "=" * 70)
     print("🔍 DIRECTORY SCAN - Processing all directories...")
     print("=" * 70)
 
-    for root, _, files in os.walk(SOURCE_DIR):
-        rel = Path(root).relative_to(SOURCE_DIR)
-
-        print(f"\n📂 Processing: {rel if rel.parts else 'ROOT'}")
+    # One post-order pass answers every subtree question for the whole run
+    dir_order, tree = scan_tree(SOURCE_DIR, exclude=EXCLUDE_DIRS)
 
-        if any(p in EXCLUDE_DIRS for p in rel.parts):
-            print("   ⏭️  Skipped (excluded directory)")
-            continue
+    for src_path in dir_order:
+        rel = src_path.relative_to(SOURCE_DIR)
+        node = tree[src_path]
 
-        md_files = sorted(
-            f for f in files if f.endswith(".md") and f.lower() != "index.md"
-        )
+        print(f"\n📂 Processing: {rel if rel.parts else 'ROOT'}")
 
-        src_path = Path(root)
-        has_recursive_md = has_markdown_files_recursive(src_path)
+        md_files = node.md_files
+        has_recursive_md = node.has_md_recursive
 
         print(f"   📄 Direct MD files: {len(md_files)}")
         print(f"   🔄 Has MD files in subdirs: {has_recursive_md}")
@@ -453,8 +758,16 @@ def sync_notes(dry_run: bool = False, clean: bool = False) -> None:
             continue
 
         target_dir = DOCS_DIR / rel
-        target_dir.mkdir(parents=True, exist_ok=True)
-        print(f"   ✅ Created/verified: {target_dir}")
+
+        # Deferred until something actually needs writing: on a
+        # steady-state run no directory pays the mkdir syscall at all
+        dir_ready = False
+
+        def ensure_dir(target_dir=target_dir):
+            nonlocal dir_ready
+            if not dir_ready:
+                target_dir.mkdir(parents=True, exist_ok=True)
+                dir_ready = True
 
         # CORRECTED LOGIC:
         # Files should be excluded from navigation based on their depth:
@@ -470,7 +783,7 @@ def sync_notes(dry_run: bool = False, clean: bool = False) -> None:
             should_exclude_files_from_nav = False
         elif depth == 1:
             # Top-level section - exclude only if it has child directories
-            should_exclude_files_from_nav = has_child_dir_with_markdown(rel)
+            should_exclude_files_from_nav = bool(node.child_dirs_with_md)
         else:
             # Depth 2+ (nested folders) - always exclude from nav
             # These files will only appear in their parent folder's TOC
@@ -494,51 +807,54 @@ def sync_notes(dry_run: bool = False, clean: bool = False) -> None:
             ) or section_title_map.get(rel.parent.name.lower(), rel.parent.name.title())
 
         # --- File sync ---
+        # Fan the independent stat/read/hash work out to the pool; futures
+        # are drained in submit order so deletions, writes, and the
+        # `updated` merge stay serial and deterministic.
+        futures = []
         for i, fname in enumerate(md_files):
-            src_file = Path(root) / fname
-            dst_file = target_dir / fname
-            body = read_file_clean(src_file)
-
-            chapter_num, title = parse_chapter_title(fname)
-            nav_order_entry = chapter_num if chapter_num is not None else (i + 1)
-
-            front_matter = f'---\ntitle: "{title}"\n'
-
-            # KEY FIX: Only set parent if file is NOT excluded from nav
-            # When nav_exclude is true, parent causes issues in Just the Docs
-            if should_exclude_files_from_nav:
-                # Excluded from nav - don't set parent, just exclude
-                front_matter += "nav_exclude: true\n"
-            else:
-                # Visible in nav - set parent and nav_order
-                if parent_title:
-                    front_matter += f"parent: {parent_title}\n"
-                front_matter += f"nav_order: {nav_order_entry}\n"
-
-            front_matter += "---\n\n"
-
-            final = front_matter + body
-            file_hash = sha256(final)
+            src_file = src_path / fname
             hash_key = str(src_file.relative_to(SOURCE_DIR))
-            updated[hash_key] = file_hash
+            futures.append(
+                (
+                    fname,
+                    hash_key,
+                    _EXECUTOR.submit(
+                        _sync_one,
+                        src_file,
+                        hash_key,
+                        fname,
+                        i + 1,
+                        parent_title,
+                        should_exclude_files_from_nav,
+                        cache,
+                        reverse_hash_map,
+                    ),
+                )
+            )
 
-            if cache.get(hash_key) != file_hash:
-                if file_hash in reverse_hash_map:
-                    old_key = reverse_hash_map[file_hash]
-                    old_path = DOCS_DIR / old_key
-                    if old_path.exists():
-                        if not dry_run:
-                            old_path.unlink()
-                        print(f"   🔄 Renamed (deleted old): {old_path}")
-                        stats["renamed"] += 1
+        for fname, hash_key, future in futures:
+            cache_entry, payload, old_path = future.result()
+            updated[hash_key] = cache_entry
 
-                if not dry_run:
-                    with open(dst_file, "w", encoding="utf-8") as f:
-                        f.write(final)
-                print(f"   {'📝 Would sync' if dry_run else '✅ Synced'}: {fname}")
-                stats["synced"] += 1
-            else:
+            if payload is None:
                 stats["unchanged"] += 1
+                continue
+
+            if old_path is not None and old_path.exists():
+                if not dry_run:
+                    old_path.unlink()
+                print(f"   🔄 Renamed (deleted old): {old_path}")
+                stats["renamed"] += 1
+
+            if not dry_run:
+                # Two chunks — the front matter + body concatenation is
+                # never materialized
+                ensure_dir()
+                dst_file = target_dir / fname
+                fm_bytes, body = payload
+                atomic_write(dst_file, fm_bytes, body)
+            print(f"   {'📝 Would sync' if dry_run else '✅ Synced'}: {fname}")
+            stats["synced"] += 1
 
         # --- Index generation for this directory ---
         if md_files or has_recursive_md:
@@ -547,8 +863,8 @@ def sync_notes(dry_run: bool = False, clean: bool = False) -> None:
             # shows child pages in the nav. We only need manual TOC for depth 2+ folders
             # where files are hidden from nav.
 
-            toc_lines: List[str] = []
-            has_subdirs = has_child_dir_with_markdown(rel)
+            toc_lines: List[Tuple[list, str]] = []
+            has_subdirs = bool(node.child_dirs_with_md)
 
             # Only generate TOC for depth 2+ folders with files
             # Don't generate for folders with has_children (nav handles it)
@@ -557,9 +873,13 @@ def sync_notes(dry_run: bool = False, clean: bool = False) -> None:
             if depth >= 2 and not has_subdirs:
                 # Depth 2+ with files (files are hidden from nav) - generate TOC
                 should_generate_toc = True
+                # The title is already in hand here, so the sort key is
+                # computed once per entry instead of per comparison
                 for fname in md_files:
                     _, t = parse_chapter_title(fname)
-                    toc_lines.append(f"- [{t}]({fname})")
+                    toc_lines.append(
+                        (_natural_title_key_from_title(t), f"- [{t}]({fname})")
+                    )
 
             # Only pass toc_lines if we should generate TOC
             toc_to_inject = toc_lines if should_generate_toc else None
@@ -581,6 +901,8 @@ def sync_notes(dry_run: bool = False, clean: bool = False) -> None:
                 nav_order=nav_order,
                 toc_lines=toc_to_inject,
                 dry_run=dry_run,
+                has_subdirs=has_subdirs,
+                ensure_dir=ensure_dir,
             )
             stats["indexes"] += 1
 
@@ -588,7 +910,7 @@ def sync_notes(dry_run: bool = False, clean: bool = False) -> None:
     print("🧹 CLEANUP PHASE - Removing orphaned files...")
     print("=" * 70)
 
-    stats["orphaned"] = clean_orphaned_files(updated, dry_run)
+    stats["orphaned"] = clean_orphaned_files(updated, dry_run, source_tree=tree)
 
     if not dry_run:
         save_hashes(updated)